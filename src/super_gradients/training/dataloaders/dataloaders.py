@@ -13,6 +13,7 @@ from super_gradients.common.factories.collate_functions_factory import CollateFu
 from super_gradients.common.factories.datasets_factory import DatasetsFactory
 from super_gradients.common.factories.samplers_factory import SamplersFactory
 from super_gradients.common.object_names import Dataloaders
+from super_gradients.training.dataloaders.num_workers_tuning import tune_num_workers
 from super_gradients.training.datasets import ImageNetDataset
 from super_gradients.training.datasets.classification_datasets.cifar import (
     Cifar10,
@@ -38,6 +39,7 @@ from super_gradients.training.utils import get_param
 from super_gradients.training.utils.distributed_training_utils import (
     wait_for_the_master,
     get_local_rank,
+    get_world_size,
 )
 from super_gradients.training.utils.utils import override_default_params_without_nones
 from super_gradients.common.environment.cfg_utils import load_dataset_params
@@ -132,6 +134,7 @@ def _process_dataloader_params(cfg, dataloader_params, dataset, train):
     default_dataloader_params = hydra.utils.instantiate(default_dataloader_params)
     dataloader_params = _process_sampler_params(dataloader_params, dataset, default_dataloader_params)
     dataloader_params = _process_collate_fn_params(dataloader_params)
+    dataloader_params = _process_num_workers_params(dataloader_params, dataset)
 
     # The following check is needed to gracefully handle the rare but possible case when the dataset length
     # is less than the number of workers. In this case DataLoader will crash.
@@ -141,6 +144,28 @@ def _process_dataloader_params(cfg, dataloader_params, dataset, train):
         num_workers = min(num_workers, len(dataset))
         dataloader_params["num_workers"] = num_workers
 
+    # Keep the workers alive between epochs by default, so the dataset is not re-initialized in every worker on each epoch.
+    # Both persistent_workers and prefetch_factor are only valid with worker processes, so they are dropped otherwise.
+    if num_workers is not None and num_workers > 0:
+        if get_param(dataloader_params, "persistent_workers") is None:
+            dataloader_params["persistent_workers"] = True
+    else:
+        dataloader_params.pop("persistent_workers", None)
+        dataloader_params.pop("prefetch_factor", None)
+
+    return dataloader_params
+
+
+def _process_num_workers_params(dataloader_params, dataset):
+    """
+    Resolve num_workers="auto" by measuring the throughput of the DataLoader with different numbers of workers.
+    The tuning runs on the master process first, so the other processes read the result from the tuning cache.
+    Since every process spawns its own workers, the CPUs are split between the processes when tuning.
+    """
+    if get_param(dataloader_params, "num_workers") == "auto":
+        with wait_for_the_master(get_local_rank()):
+            dataloader_params["num_workers"] = tune_num_workers(dataset=dataset, dataloader_params=dataloader_params, num_processes=get_world_size())
+
     return dataloader_params
 
 
@@ -886,6 +911,7 @@ def get(name: str = None, dataset_params: Dict = None, dataloader_params: Dict =
 
     if dataset is not None:
         dataloader_params = _process_sampler_params(dataloader_params, dataset, {})
+        dataloader_params = _process_num_workers_params(dataloader_params, dataset)
         dataloader = DataLoader(dataset=dataset, **dataloader_params)
     elif name not in ALL_DATALOADERS.keys():
         raise ValueError("Unsupported dataloader: " + str(name))
@@ -0,0 +1,114 @@
+import json
+import os
+import time
+from typing import Mapping, Sequence
+
+from torch.utils.data import DataLoader, Dataset
+
+from super_gradients.common.abstractions.abstract_logger import get_logger
+from super_gradients.training.utils import get_param
+
+logger = get_logger(__name__)
+
+DEFAULT_NUM_WORKERS_CANDIDATES = (1, 2, 4, 8)
+NUM_WORKERS_TUNING_CACHE_PATH = os.path.expanduser("~/.cache/sg_dataloader_tuning.json")
+
+
+def tune_num_workers(
+    dataset: Dataset,
+    dataloader_params: Mapping,
+    candidate_values: Sequence[int] = DEFAULT_NUM_WORKERS_CANDIDATES,
+    n_iters: int = 50,
+    n_warmup_iters: int = 5,
+    cache_path: str = NUM_WORKERS_TUNING_CACHE_PATH,
+    num_processes: int = 1,
+) -> int:
+    """
+    Select the number of DataLoader workers that gives the highest throughput, by timing a few iterations with each candidate value.
+    More workers is not always faster (i.e. when the workers contend for CPU or memory bandwidth), so the best value is measured rather than assumed.
+    The result is cached on disk, keyed by the dataset, batch size and number of processes, so the measurement only runs once per setup.
+
+    :param dataset:             Dataset to load.
+    :param dataloader_params:   DataLoader params (other than num_workers) that will be used to load the dataset.
+    :param candidate_values:    Numbers of workers to try. Values above the number of CPUs available to each process are skipped.
+    :param n_iters:             Number of batches timed for each candidate.
+    :param n_warmup_iters:      Minimum number of batches loaded (and not timed) before timing each candidate, to exclude the workers startup.
+                                At least num_workers * prefetch_factor batches are loaded, so the batches queued by the workers during startup are not timed.
+    :param cache_path:          Path of the json file in which the results are cached.
+    :param num_processes:       Number of processes on this machine that will each load the dataset with the selected number of workers (i.e. in DDP).
+                                The measurement runs in a single process, so the CPUs are split between the processes when selecting the candidates.
+    :return:                    Number of workers with the highest throughput.
+    """
+    cache_key = _get_cache_key(dataset=dataset, dataloader_params=dataloader_params, num_processes=num_processes)
+    cache = _load_cache(cache_path)
+    if cache_key in cache:
+        logger.info(f"Using num_workers={cache[cache_key]} from the dataloader tuning cache ({cache_path})")
+        return cache[cache_key]
+
+    cpus_per_process = max((os.cpu_count() or 1) // num_processes, 1)
+    candidate_values = [num_workers for num_workers in candidate_values if num_workers <= cpus_per_process] or [min(candidate_values)]
+
+    logger.info(f"Tuning the number of dataloader workers among {candidate_values}. This may take a few minutes")
+    best_num_workers, best_throughput = candidate_values[0], 0.0
+    for num_workers in candidate_values:
+        throughput = _measure_throughput(dataset, dataloader_params, num_workers=num_workers, n_iters=n_iters, n_warmup_iters=n_warmup_iters)
+        logger.info(f"num_workers={num_workers}: {throughput:.2f} batches/s")
+        if throughput > best_throughput:
+            best_num_workers, best_throughput = num_workers, throughput
+
+    logger.info(f"Selected num_workers={best_num_workers}")
+    cache[cache_key] = best_num_workers
+    _save_cache(cache, cache_path)
+    return best_num_workers
+
+
+def _measure_throughput(dataset: Dataset, dataloader_params: Mapping, num_workers: int, n_iters: int, n_warmup_iters: int) -> float:
+    """Measure the throughput (in batches per second) of a DataLoader with a given number of workers."""
+    dataloader_params = dict(dataloader_params)
+    dataloader_params["num_workers"] = num_workers
+    dataloader_params["persistent_workers"] = False
+
+    # Batches prefetched by the workers while starting up are returned immediately, so they would inflate the throughput of larger candidates
+    prefetch_factor = get_param(dataloader_params, "prefetch_factor") or 2
+    n_warmup_iters = max(n_warmup_iters, num_workers * prefetch_factor)
+
+    iterator = iter(DataLoader(dataset=dataset, **dataloader_params))
+    for _ in range(n_warmup_iters):
+        if next(iterator, None) is None:
+            return 0.0
+
+    num_batches = 0
+    start_time = time.perf_counter()
+    while num_batches < n_iters and next(iterator, None) is not None:
+        num_batches += 1
+    elapsed_time = time.perf_counter() - start_time
+    del iterator  # Shut down the workers before trying the next candidate
+
+    return num_batches / elapsed_time if num_batches > 0 else 0.0
+
+
+def _get_cache_key(dataset: Dataset, dataloader_params: Mapping, num_processes: int) -> str:
+    dataset_params = getattr(dataset, "dataset_params", None) or {}
+    input_dim = get_param(dataset_params, "input_dim")
+    batch_size = get_param(dataloader_params, "batch_size", 1)
+    return f"{type(dataset).__name__}_len={len(dataset)}_input_dim={input_dim}_batch_size={batch_size}_cpus={os.cpu_count()}_num_processes={num_processes}"
+
+
+def _load_cache(cache_path: str) -> dict:
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        logger.warning(f"Could not read the dataloader tuning cache from {cache_path}, ignoring it")
+        return {}
+
+
+def _save_cache(cache: dict, cache_path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        logger.warning(f"Could not write the dataloader tuning cache to {cache_path}")
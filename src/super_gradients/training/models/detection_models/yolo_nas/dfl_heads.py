@@ -1,4 +1,6 @@
+import copy
 import math
+from functools import lru_cache
 from typing import Tuple, Union, List, Callable, Optional
 
 import torch
@@ -6,6 +8,7 @@ from omegaconf import DictConfig
 from torch import nn, Tensor
 
 import super_gradients.common.factories.detection_modules_factory as det_factory
+from super_gradients.common.abstractions.abstract_logger import get_logger
 from super_gradients.common.registry import register_detection_module
 from super_gradients.modules import ConvBNReLU
 from super_gradients.modules.base_modules import BaseDetectionModule
@@ -15,6 +18,8 @@ from super_gradients.training.models.detection_models.pp_yolo_e.pp_yolo_head imp
 from super_gradients.training.utils import HpmStruct, torch_version_is_greater_or_equal
 from super_gradients.training.utils.bbox_utils import batch_distance2bbox
 
+logger = get_logger(__name__)
+
 
 @register_detection_module()
 class YoloNASDFLHead(BaseDetectionModule, SupportsReplaceNumClasses):
@@ -61,6 +66,9 @@ class YoloNASDFLHead(BaseDetectionModule, SupportsReplaceNumClasses):
         first_reg_conv = [ConvBNReLU(inter_channels, inter_channels, kernel_size=3, stride=1, padding=1, groups=groups, bias=False)] if groups else []
         self.reg_convs = nn.Sequential(*first_reg_conv, ConvBNReLU(inter_channels, inter_channels, kernel_size=3, stride=1, padding=1, bias=False))
 
+        # Set in prep_model_for_conversion, when the first cls and reg convolutions are merged into a single convolution
+        self.fused_first_convs = None
+
         self.cls_pred = nn.Conv2d(inter_channels, self.num_classes, 1, 1, 0)
         self.reg_pred = nn.Conv2d(inter_channels, 4 * (reg_max + 1), 1, 1, 0)
 
@@ -84,16 +92,34 @@ class YoloNASDFLHead(BaseDetectionModule, SupportsReplaceNumClasses):
     def forward(self, x):
         x = self.stem(x)
 
-        cls_feat = self.cls_convs(x)
+        if self.fused_first_convs is not None:
+            cls_feat, reg_feat = self.fused_first_convs(x).chunk(2, dim=1)
+        else:
+            cls_feat, reg_feat = x, x
+
+        cls_feat = self.cls_convs(cls_feat)
         cls_feat = self.cls_dropout_rate(cls_feat)
         cls_output = self.cls_pred(cls_feat)
 
-        reg_feat = self.reg_convs(x)
+        reg_feat = self.reg_convs(reg_feat)
         reg_feat = self.reg_dropout_rate(reg_feat)
         reg_output = self.reg_pred(reg_feat)
 
         return reg_output, cls_output
 
+    def prep_model_for_conversion(self, input_size: Optional[Union[tuple, list]] = None, **kwargs):
+        """
+        Merge the first convolutions of the classification and regression branches into a single convolution with twice the output channels,
+        since both of them are applied on the stem output.
+
+        :WARNING: This changes the module structure, so the state_dict keys of the first convolutions change as well.
+                  Checkpoints should be saved (and loaded) before calling this method.
+        """
+        if self.fused_first_convs is None and _can_concat_conv_bn_relu(self.cls_convs[0], self.reg_convs[0]):
+            self.fused_first_convs = _concat_conv_bn_relu(self.cls_convs[0], self.reg_convs[0])
+            self.cls_convs = self.cls_convs[1:]
+            self.reg_convs = self.reg_convs[1:]
+
     def _initialize_biases(self):
         prior_bias = -math.log((1 - self.prior_prob) / self.prior_prob)
         torch.nn.init.constant_(self.cls_pred.bias, prior_bias)
@@ -108,6 +134,68 @@ class YoloNASDFLHead(BaseDetectionModule, SupportsReplaceNumClasses):
         return torch.stack((xv, yv), 2).view((1, 1, ny, nx, 2)).float()
 
 
+def _can_concat_conv_bn_relu(first: nn.Module, second: nn.Module) -> bool:
+    """
+    Check whether two ConvBNReLU blocks can be merged into a single one by concatenating their output channels.
+    That is the case when both are plain (i.e. not quantized) ungrouped Conv2d-BatchNorm2d-ReLU blocks with the same convolution parameters.
+    """
+    if not isinstance(first, ConvBNReLU) or not isinstance(second, ConvBNReLU):
+        return False
+    first_layers, second_layers = dict(first.seq.named_children()), dict(second.seq.named_children())
+    if first_layers.keys() != {"conv", "bn", "act"} or second_layers.keys() != {"conv", "bn", "act"}:
+        return False
+
+    first_conv, second_conv = first_layers["conv"], second_layers["conv"]
+    if type(first_conv) is not nn.Conv2d or type(second_conv) is not nn.Conv2d or first_conv.groups != 1 or second_conv.groups != 1:
+        return False
+    conv_params = ("in_channels", "kernel_size", "stride", "padding", "dilation", "padding_mode")
+    if any(getattr(first_conv, param) != getattr(second_conv, param) for param in conv_params):
+        return False
+    if (first_conv.bias is None) != (second_conv.bias is None):
+        return False
+
+    first_bn, second_bn = first_layers["bn"], second_layers["bn"]
+    if type(first_bn) is not nn.BatchNorm2d or type(second_bn) is not nn.BatchNorm2d or first_bn.eps != second_bn.eps:
+        return False
+    if not first_bn.affine or not second_bn.affine or not first_bn.track_running_stats or not second_bn.track_running_stats:
+        return False
+
+    first_act, second_act = first_layers["act"], second_layers["act"]
+    return isinstance(second_act, type(first_act)) and isinstance(first_act, type(second_act))
+
+
+@torch.no_grad()
+def _concat_conv_bn_relu(first: ConvBNReLU, second: ConvBNReLU) -> ConvBNReLU:
+    """
+    Merge two ConvBNReLU blocks applied on the same input into a single one, whose output is the concatenation of both outputs along the channels.
+    Assumes _can_concat_conv_bn_relu(first, second) is True.
+    """
+    fused = copy.deepcopy(first)
+    first_conv, second_conv = first.seq.conv, second.seq.conv
+    fused.seq.conv = nn.Conv2d(
+        first_conv.in_channels,
+        first_conv.out_channels + second_conv.out_channels,
+        kernel_size=first_conv.kernel_size,
+        stride=first_conv.stride,
+        padding=first_conv.padding,
+        dilation=first_conv.dilation,
+        bias=first_conv.bias is not None,
+        padding_mode=first_conv.padding_mode,
+    ).to(device=first_conv.weight.device, dtype=first_conv.weight.dtype)
+    fused.seq.conv.weight.copy_(torch.cat([first_conv.weight, second_conv.weight], dim=0))
+    if first_conv.bias is not None:
+        fused.seq.conv.bias.copy_(torch.cat([first_conv.bias, second_conv.bias], dim=0))
+
+    first_bn, second_bn = first.seq.bn, second.seq.bn
+    fused.seq.bn = nn.BatchNorm2d(first_bn.num_features + second_bn.num_features, eps=first_bn.eps, momentum=first_bn.momentum).to(
+        device=first_bn.weight.device, dtype=first_bn.weight.dtype
+    )
+    for name in ("weight", "bias", "running_mean", "running_var"):
+        getattr(fused.seq.bn, name).copy_(torch.cat([getattr(first_bn, name), getattr(second_bn, name)], dim=0))
+    fused.train(first.training)
+    return fused
+
+
 @register_detection_module()
 class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
     def __init__(
@@ -120,6 +208,7 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
         reg_max: int = 16,
         eval_size: Optional[Tuple[int, int]] = None,
         width_mult: float = 1.0,
+        torch_compile_eval: bool = False,
     ):
         """
         Initializes the NDFLHeads module.
@@ -132,6 +221,9 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
         :param eval_size: (rows, cols) Size of the image for evaluation. Setting this value can be beneficial for inference speed,
                since anchors will not be regenerated for each forward call.
         :param width_mult: A scaling factor applied to in_channels.
+        :param torch_compile_eval: If True, run the inference forward pass (including the heads) through torch.compile with CUDA graphs.
+               Works best together with eval_size, since the shapes are then static. Requires PyTorch 2.0 or greater.
+               Note that the outputs of a call are overwritten by the next call, so they should be consumed (or cloned) before calling again.
         """
         super(NDFLHeads, self).__init__(in_channels)
         in_channels = [max(round(c * width_mult), 1) for c in in_channels]
@@ -142,10 +234,14 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
         self.grid_cell_offset = grid_cell_offset
         self.reg_max = reg_max
         self.eval_size = eval_size
+        self.torch_compile_eval = torch_compile_eval
+        if self.torch_compile_eval and not torch_version_is_greater_or_equal(2, 0):
+            logger.warning(f"torch.compile is not supported in this version of PyTorch ({torch.__version__}). Ignoring torch_compile_eval flag")
+            self.torch_compile_eval = False
 
         # Do not apply quantization to this tensor
-        proj = torch.linspace(0, self.reg_max, self.reg_max + 1).reshape([1, self.reg_max + 1, 1, 1])
-        self.register_buffer("proj_conv", proj, persistent=False)
+        proj = torch.linspace(0, self.reg_max, self.reg_max + 1)
+        self.register_buffer("proj", proj, persistent=False)
 
         self._init_weights()
 
@@ -209,26 +305,19 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
 
     def forward_eval(self, feats: Tuple[Tensor, ...]) -> Tuple[Tuple[Tensor, Tensor], Tuple[Tensor, ...]]:
 
-        cls_score_list, reg_distri_list, reg_dist_reduced_list = [], [], []
-
+        cls_logit_list, reg_distri_list = [], []
         for i, feat in enumerate(feats):
-            b, _, h, w = feat.shape
-            height_mul_width = h * w
             reg_distri, cls_logit = getattr(self, f"head{i + 1}")(feat)
-            reg_distri_list.append(torch.permute(reg_distri.flatten(2), [0, 2, 1]))
+            cls_logit_list.append(cls_logit.flatten(2))  # [B, C, H * W]
+            reg_distri_list.append(reg_distri.flatten(2))  # [B, 4 * (self.reg_max + 1), H * W]
 
-            reg_dist_reduced = torch.permute(reg_distri.reshape([-1, 4, self.reg_max + 1, height_mul_width]), [0, 2, 3, 1])
-            reg_dist_reduced = torch.nn.functional.conv2d(torch.nn.functional.softmax(reg_dist_reduced, dim=1), weight=self.proj_conv).squeeze(1)
+        cls_score_list = self._concat_levels(cls_logit_list)  # [B, Anchors, C]
+        reg_distri_list = self._concat_levels(reg_distri_list)  # [B, Anchors, 4 * (self.reg_max + 1)]
 
-            # cls and reg
-            cls_score_list.append(cls_logit.reshape([b, self.num_classes, height_mul_width]))
-            reg_dist_reduced_list.append(reg_dist_reduced)
-
-        cls_score_list = torch.cat(cls_score_list, dim=-1)  # [B, C, Anchors]
-        cls_score_list = torch.permute(cls_score_list, [0, 2, 1])  # # [B, Anchors, C]
-
-        reg_distri_list = torch.cat(reg_distri_list, dim=1)  # [B, Anchors, 4 * (self.reg_max + 1)]
-        reg_dist_reduced_list = torch.cat(reg_dist_reduced_list, dim=1)  # [B, Anchors, 4]
+        # Expected value of each bins distribution, computed as a dot product with the projection vector: [B, Anchors, 4]
+        b, num_anchors, _ = reg_distri_list.shape
+        reg_dist_reduced = reg_distri_list.reshape([b, num_anchors, 4, self.reg_max + 1])
+        reg_dist_reduced_list = torch.matmul(torch.nn.functional.softmax(reg_dist_reduced, dim=-1), self.proj)
 
         # Decode bboxes
         # Note in eval mode, anchor_points_inference is different from anchor_points computed on train
@@ -250,6 +339,27 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
         raw_predictions = cls_score_list, reg_distri_list, anchors, anchor_points, num_anchors_list, stride_tensor
         return decoded_predictions, raw_predictions
 
+    @staticmethod
+    def _concat_levels(level_outputs: List[Tensor]) -> Tensor:
+        """
+        Concatenate the outputs of all FPN levels along the anchors dimension.
+
+        :param level_outputs: List of per-level outputs, each of shape [B, C, H * W]
+        :return:              Tensor of shape [B, Anchors, C]
+        """
+        if torch.jit.is_tracing() or torch.jit.is_scripting():
+            # Keep the exported graph free of in-place slice assignments
+            return torch.permute(torch.cat(level_outputs, dim=-1), [0, 2, 1])
+
+        b, c, _ = level_outputs[0].shape
+        num_anchors = sum(level_output.shape[-1] for level_output in level_outputs)
+        output = level_outputs[0].new_empty((b, num_anchors, c))
+        offset = 0
+        for level_output in level_outputs:
+            output[:, offset : offset + level_output.shape[-1]].copy_(level_output.transpose(1, 2))
+            offset += level_output.shape[-1]
+        return output
+
     @property
     def out_channels(self):
         return None
@@ -257,6 +367,8 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
     def forward(self, feats: Tuple[Tensor]):
         if self.training:
             return self.forward_train(feats)
+        elif self.torch_compile_eval and not torch.jit.is_tracing() and not torch.jit.is_scripting():
+            return _get_compiled_forward_eval(type(self))(self, feats)
         else:
             return self.forward_eval(feats)
 
@@ -286,3 +398,15 @@ class NDFLHeads(BaseDetectionModule, SupportsReplaceNumClasses):
             anchor_points = anchor_points.to(feats[0].device)
             stride_tensor = stride_tensor.to(feats[0].device)
         return anchor_points, stride_tensor
+
+
+@lru_cache(maxsize=None)
+def _get_compiled_forward_eval(heads_cls: type) -> Callable:
+    """
+    Compile the forward_eval method of a heads class once. The unbound method of the actual class is compiled (so overrides in subclasses are respected),
+    rather than storing a compiled bound method on the instance, so the module remains deep-copyable and every copy runs its own weights.
+
+    :param heads_cls: Class of the heads (NDFLHeads or a subclass)
+    :return:          Compiled forward_eval, to be called with the heads instance as first argument
+    """
+    return torch.compile(heads_cls.forward_eval, mode="reduce-overhead", dynamic=False)
@@ -1,5 +1,7 @@
 from super_gradients.training.models.sg_module import SgModule
 from collections import namedtuple
+from functools import lru_cache
+from typing import Union
 import torch
 
 from super_gradients.common.registry.registry import register_kd_model, register_model
@@ -64,18 +66,36 @@ class KDModule(SgModule):
         self.teacher.eval()
 
     def forward(self, x):
-        if self.student_input_adapter is not None:
-            student_output = self.student(self.student_input_adapter(x))
-        else:
-            student_output = self.student(x)
+        if not isinstance(x, torch.Tensor) or not x.is_cuda or torch.jit.is_tracing():
+            return KDOutput(student_output=self._student_forward(x), teacher_output=self._teacher_forward(x))
 
-        if self.teacher_input_adapter is not None:
-            teacher_output = self.teacher(self.teacher_input_adapter(x))
-        else:
-            teacher_output = self.teacher(x)
+        # THE TEACHER AND STUDENT FORWARD PASSES ARE INDEPENDENT, SO THE TEACHER IS RUN ON A SIDE STREAM TO OVERLAP WITH THE STUDENT
+        current_stream = torch.cuda.current_stream(x.device)
+        teacher_stream = _get_teacher_stream(x.device)
+        teacher_stream.wait_stream(current_stream)
+        x.record_stream(teacher_stream)
+        with torch.cuda.stream(teacher_stream):
+            teacher_output = self._teacher_forward(x)
 
+        student_output = self._student_forward(x)
+
+        current_stream.wait_stream(teacher_stream)
+        _record_stream(teacher_output, current_stream)
         return KDOutput(student_output=student_output, teacher_output=teacher_output)
 
+    def _student_forward(self, x):
+        if self.student_input_adapter is not None:
+            return self.student(self.student_input_adapter(x))
+        return self.student(x)
+
+    def _teacher_forward(self, x):
+        # THE TEACHER IS FROZEN, SO ITS ACTIVATIONS DON'T NEED TO BE KEPT FOR BACKWARD.
+        # NOTE: torch.inference_mode() CAN'T BE USED HERE SINCE THE TEACHER OUTPUT IS SAVED FOR BACKWARD BY THE KD LOSS.
+        with torch.no_grad():
+            if self.teacher_input_adapter is not None:
+                return self.teacher(self.teacher_input_adapter(x))
+            return self.teacher(x)
+
     def initialize_param_groups(self, lr: float, training_params: HpmStruct) -> list:
         return self.student.initialize_param_groups(lr, training_params)
 
@@ -84,3 +104,27 @@ class KDModule(SgModule):
 
     def replace_head(self, **kwargs):
         self.student.replace_head(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_teacher_stream(device: torch.device) -> torch.cuda.Stream:
+    """
+    Returns the CUDA stream used to run the teacher forward pass on a given device.
+    The streams are kept outside of KDModule so the module remains deep-copyable (i.e. for EMA).
+    """
+    return torch.cuda.Stream(device=device)
+
+
+def _record_stream(obj: Union[torch.Tensor, tuple, list, dict], stream: torch.cuda.Stream) -> None:
+    """
+    Recursively mark all the tensors of a compounded object as used by stream, so their memory is not reused
+    by the caching allocator before the work queued on stream is done.
+    """
+    if isinstance(obj, torch.Tensor):
+        obj.record_stream(stream)
+    elif isinstance(obj, (tuple, list)):
+        for x in obj:
+            _record_stream(x, stream)
+    elif isinstance(obj, dict):
+        for x in obj.values():
+            _record_stream(x, stream)
@@ -1,7 +1,7 @@
 import copy
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union, Iterable
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from tqdm import tqdm
 
 import numpy as np
@@ -26,7 +26,7 @@ from super_gradients.training.utils.predict import (
 )
 from torch.nn.functional import softmax
 from super_gradients.training.utils.utils import generate_batch
-from super_gradients.training.utils.media.video import load_video, includes_video_extension
+from super_gradients.training.utils.media.video import lazy_load_video, includes_video_extension
 from super_gradients.training.utils.media.image import ImageSource, check_image_typing
 from super_gradients.training.utils.media.stream import WebcamStreaming
 from super_gradients.training.utils.detection_utils import DetectionPostPredictionCallback
@@ -45,8 +45,10 @@ def eval_mode(model: SgModule) -> None:
     """
     _starting_mode = model.training
     model.eval()
-    yield
-    model.train(mode=_starting_mode)
+    try:
+        yield
+    finally:
+        model.train(mode=_starting_mode)
 
 
 class Pipeline(ABC):
@@ -79,12 +81,23 @@ class Pipeline(ABC):
         self.image_processor = image_processor
 
         self.fuse_model = fuse_model  # If True, the model will be fused in the first forward pass, to make sure it gets the right input_size
+        self._owns_model = False  # True once self.model is the pipeline's own (fused) copy, which always stays in eval mode
+
+        # NHWC convolution kernels are faster on GPU (especially with mixed precision), but not necessarily on CPU.
+        # Only the inputs and the fused copy of the model are converted, the model passed by the user is left in its own memory format.
+        self.channels_last = torch.device(self.device).type == "cuda"
+
+        self._staged_inputs: Optional[torch.Tensor] = None  # Staging buffer for the input batches (page-locked on GPU), allocated lazily
+        self._staged_inputs_copied: Optional[torch.cuda.Event] = None  # Recorded after the last copy from the staging buffer to the GPU
 
     def _fuse_model(self, input_example: torch.Tensor):
         logger.info("Fusing some of the model's layers. If this takes too much memory, you can deactivate it by setting `fuse_model=False`")
         self.model = copy.deepcopy(self.model)
         self.model.eval()
         self.model.prep_model_for_conversion(input_size=input_example.shape[-2:])
+        self._owns_model = True
+        if self.channels_last:
+            self.model = self.model.to(memory_format=torch.channels_last)
         self.fuse_model = False
 
     def __call__(self, inputs: Union[str, ImageSource, List[ImageSource]], batch_size: Optional[int] = 32) -> ImagesPredictions:
@@ -129,9 +142,9 @@ class Pipeline(ABC):
         :param batch_size:  The size of each batch.
         :return:            Results of the prediction.
         """
-        video_frames, fps = load_video(file_path=video_path)
+        video_frames, n_frames, fps = lazy_load_video(file_path=video_path)
         result_generator = self._generate_prediction_result(images=video_frames, batch_size=batch_size)
-        return self._combine_image_prediction_to_video(result_generator, fps=fps, n_images=len(video_frames))
+        return self._combine_image_prediction_to_video(result_generator, fps=fps, n_images=n_frames)
 
     def predict_webcam(self) -> None:
         """Predict using webcam"""
@@ -171,21 +184,21 @@ class Pipeline(ABC):
         :return:        Iterable of Results object, each containing the results of the prediction and the image.
         """
         images = list(images)  # We need to load all the images into memory, and to reuse it afterwards.
-        self.model = self.model.to(self.device)  # Make sure the model is on the correct device, as it might have been moved after init
+        self._ensure_model_on_device()  # Make sure the model is on the correct device, as it might have been moved after init
 
         # Preprocess
-        preprocessed_images, processing_metadatas = [], []
-        for image in images:
-            preprocessed_image, processing_metadata = self.image_processor.preprocess_image(image=image.copy())
-            preprocessed_images.append(preprocessed_image)
-            processing_metadatas.append(processing_metadata)
+        preprocessed_images, processing_metadatas = self.image_processor.preprocess_images(images=images)
 
         # Predict
-        with eval_mode(self.model), torch.no_grad(), torch.cuda.amp.autocast():
-            torch_inputs = torch.from_numpy(np.array(preprocessed_images)).to(self.device)
+        # inference_mode is safe here since the predictions are only used to build the (numpy) results, never for autograd
+        # The fused copy is put in eval mode once when created, so only the user's model needs to be switched (and restored) on every call
+        with nullcontext() if self._owns_model else eval_mode(self.model), torch.inference_mode(), torch.cuda.amp.autocast():
+            torch_inputs = self._images_to_device(preprocessed_images)
             torch_inputs = torch_inputs.to(self.dtype)
             if self.fuse_model:
                 self._fuse_model(torch_inputs)
+            if self.channels_last:
+                torch_inputs = torch_inputs.contiguous(memory_format=torch.channels_last)
             model_output = self.model(torch_inputs)
             predictions = self._decode_model_output(model_output, model_input=torch_inputs)
 
@@ -199,6 +212,49 @@ class Pipeline(ABC):
         for image, prediction in zip(images, postprocessed_predictions):
             yield self._instantiate_image_prediction(image=image, prediction=prediction)
 
+    def _ensure_model_on_device(self) -> None:
+        """Move the model to the device of the pipeline, unless it is already there.
+        Checking a single parameter is much cheaper than calling `model.to`, which walks over all the parameters and buffers.
+        """
+        device = torch.device(self.device)
+        if device.type == "cuda" and device.index is None:
+            device = torch.device("cuda", torch.cuda.current_device())  # "cuda" refers to the current device, as in `model.to("cuda")`
+        if next(self.model.parameters()).device != device:
+            self.model = self.model.to(device)
+
+    def _images_to_device(self, preprocessed_images: List[np.ndarray]) -> torch.Tensor:
+        """Stack the preprocessed images into a single batch and move it to the device of the pipeline.
+
+        The images are stacked directly into a staging buffer that is reused across batches, instead of allocating a new batch every call.
+        On GPU, this buffer is page-locked, which allows the host to device copy to be asynchronous.
+
+        :param preprocessed_images: List of preprocessed images, all of the same shape.
+        :return:                    Batch of images on the device of the pipeline.
+        """
+        batch_size, image = len(preprocessed_images), preprocessed_images[0]
+        dtype = torch.from_numpy(np.empty(0, dtype=image.dtype)).dtype
+        on_cuda = torch.device(self.device).type == "cuda"
+
+        staged_inputs = self._staged_inputs
+        can_reuse_buffer = (
+            staged_inputs is not None and len(staged_inputs) >= batch_size and tuple(staged_inputs.shape[1:]) == image.shape and staged_inputs.dtype == dtype
+        )
+        if not can_reuse_buffer:
+            staged_inputs = torch.empty((batch_size, *image.shape), dtype=dtype, pin_memory=on_cuda)
+            self._staged_inputs = staged_inputs
+
+        # The previous copy from the buffer to the GPU is asynchronous, so it has to be done before the buffer is overwritten
+        if self._staged_inputs_copied is not None:
+            self._staged_inputs_copied.synchronize()
+            self._staged_inputs_copied = None
+
+        np.stack(preprocessed_images, out=staged_inputs[:batch_size].numpy())
+        device_inputs = staged_inputs[:batch_size].to(self.device, non_blocking=True)
+        if on_cuda:
+            self._staged_inputs_copied = torch.cuda.Event()
+            self._staged_inputs_copied.record()
+        return device_inputs
+
     @abstractmethod
     def _decode_model_output(self, model_output: Union[List, Tuple, torch.Tensor], model_input: np.ndarray) -> List[Prediction]:
         """Decode the model outputs, move each prediction to numpy and store it in a Prediction object.
@@ -275,11 +331,17 @@ class DetectionPipeline(Pipeline):
         :return:                Predicted Bboxes.
         """
         post_nms_predictions = self.post_prediction_callback(model_output, device=self.device)
+        post_nms_predictions = [
+            prediction if prediction is not None else torch.zeros((0, 6), dtype=torch.float32, device=model_input.device) for prediction in post_nms_predictions
+        ]
+
+        # Move all the predictions to cpu at once, to synchronize with the device only once per batch.
+        num_predictions = [len(prediction) for prediction in post_nms_predictions]
+        all_predictions = torch.cat(post_nms_predictions, dim=0).detach().cpu().numpy()
+        post_nms_predictions = np.split(all_predictions, np.cumsum(num_predictions)[:-1])
 
         predictions = []
         for prediction, image in zip(post_nms_predictions, model_input):
-            prediction = prediction if prediction is not None else torch.zeros((0, 6), dtype=torch.float32)
-            prediction = prediction.detach().cpu().numpy()
             predictions.append(
                 DetectionPrediction(
                     bboxes=prediction[:, :4],
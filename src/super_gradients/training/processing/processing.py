@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple, List, Union
+from typing import Tuple, List, Union, Optional
 
 import numpy as np
 from PIL import Image
@@ -44,6 +44,17 @@ class RescaleMetadata(ProcessingMetadata):
     scale_factor_w: float
 
 
+def _stack_images(images: List[np.ndarray]) -> Optional[np.ndarray]:
+    """Stack images into a single (B, ...) array, so that size-invariant processings can be applied to the whole batch at once.
+
+    :param images:  Images to stack.
+    :return:        Stacked images, or None if the images don't all have the same shape and dtype.
+    """
+    if len(images) == 0 or any(image.shape != images[0].shape or image.dtype != images[0].dtype for image in images):
+        return None
+    return np.stack(images)
+
+
 class Processing(ABC):
     """Interface for preprocessing and postprocessing methods that are
     used to prepare images for a model and process the model's output.
@@ -57,6 +68,17 @@ class Processing(ABC):
         """Processing an image, before feeding it to the network. Expected to be in (H, W, C) or (H, W)."""
         pass
 
+    def preprocess_images(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[Union[None, ProcessingMetadata]]]:
+        """Processing a batch of images, before feeding them to the network. Each image is expected to be in (H, W, C) or (H, W).
+        By default, images are processed one by one. Override this method to process the whole batch at once.
+        """
+        processed_images, metadata_lst = [], []
+        for image in images:
+            processed_image, metadata = self.preprocess_image(image=image)
+            processed_images.append(processed_image)
+            metadata_lst.append(metadata)
+        return processed_images, metadata_lst
+
     @abstractmethod
     def postprocess_predictions(self, predictions: Prediction, metadata: Union[None, ProcessingMetadata]) -> Prediction:
         """Postprocess the model output predictions."""
@@ -78,6 +100,18 @@ class ComposeProcessing(Processing):
             metadata_lst.append(metadata)
         return processed_image, ComposeProcessingMetadata(metadata_lst=metadata_lst)
 
+    def preprocess_images(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[ComposeProcessingMetadata]]:
+        """Processing a batch of images, before feeding it to the network. Each processing is applied to the whole batch."""
+        processed_images, metadata_per_processing = [image.copy() for image in images], []
+        for processing in self.processings:
+            processed_images, metadata_lst = processing.preprocess_images(images=processed_images)
+            metadata_per_processing.append(metadata_lst)
+
+        compose_metadata_lst = [
+            ComposeProcessingMetadata(metadata_lst=[metadata_lst[i] for metadata_lst in metadata_per_processing]) for i in range(len(processed_images))
+        ]
+        return processed_images, compose_metadata_lst
+
     def postprocess_predictions(self, predictions: Prediction, metadata: ComposeProcessingMetadata) -> Prediction:
         """Postprocess the model output predictions."""
         postprocessed_predictions = predictions
@@ -100,6 +134,13 @@ class ImagePermute(Processing):
         processed_image = np.ascontiguousarray(image.transpose(*self.permutation))
         return processed_image, None
 
+    def preprocess_images(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[None]]:
+        batch = _stack_images(images)
+        if batch is None:
+            return super().preprocess_images(images=images)
+        processed_batch = np.ascontiguousarray(batch.transpose(0, *(axis + 1 for axis in self.permutation)))
+        return list(processed_batch), [None] * len(images)
+
     def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
         return predictions
 
@@ -145,6 +186,13 @@ class StandardizeImage(Processing):
         processed_image = (image / self.max_value).astype(np.float32)
         return processed_image, None
 
+    def preprocess_images(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[None]]:
+        batch = _stack_images(images)
+        if batch is None:
+            return super().preprocess_images(images=images)
+        processed_batch = (batch / self.max_value).astype(np.float32)
+        return list(processed_batch), [None] * len(images)
+
     def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
         return predictions
 
@@ -164,6 +212,12 @@ class NormalizeImage(Processing):
     def preprocess_image(self, image: np.ndarray) -> Tuple[np.ndarray, None]:
         return (image - self.mean) / self.std, None
 
+    def preprocess_images(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[None]]:
+        batch = _stack_images(images)
+        if batch is None:
+            return super().preprocess_images(images=images)
+        return list((batch - self.mean) / self.std), [None] * len(images)
+
     def postprocess_predictions(self, predictions: Prediction, metadata: None) -> Prediction:
         return predictions
 
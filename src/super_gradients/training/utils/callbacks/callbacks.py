@@ -712,6 +712,11 @@ class YoloXTrainingStageSwitchCallback(TrainingStageSwitchCallbackBase):
         for transform in context.train_loader.dataset.transforms:
             if hasattr(transform, "close"):
                 transform.close()
+
+        # PERSISTENT WORKERS HOLD THEIR OWN COPY OF THE DATASET, SO THEY MUST BE RESTARTED FOR THE CHANGE TO TAKE EFFECT
+        if getattr(context.train_loader, "persistent_workers", False) and context.train_loader._iterator is not None:
+            context.train_loader._iterator._shutdown_workers()
+            context.train_loader._iterator = None
         iter(context.train_loader)
         context.criterion.use_l1 = True
 
@@ -718,13 +718,12 @@ class DetectionCollateFN:
         :return: one tensor of targets of all imahes of shape [N, 6], where N is the total number of targets in a batch
                  and the 1st column is batch item index
         """
-        labels_batch = [torch.tensor(labels) for labels in labels_batch]
-        labels_batch_indexed = []
-        for i, labels in enumerate(labels_batch):
-            batch_column = labels.new_ones((labels.shape[0], 1)) * i
-            labels = torch.cat((batch_column, labels), dim=-1)
-            labels_batch_indexed.append(labels)
-        return torch.cat(labels_batch_indexed, 0)
+        labels_batch = [torch.as_tensor(labels) for labels in labels_batch]
+        labels = torch.cat(labels_batch, dim=0)
+
+        num_labels_per_image = torch.tensor([image_labels.shape[0] for image_labels in labels_batch])
+        batch_column = torch.arange(len(labels_batch), dtype=labels.dtype).repeat_interleave(num_labels_per_image).unsqueeze(1)
+        return torch.cat((batch_column, labels), dim=-1)
 
 
 class PPYoloECollateFN(DetectionCollateFN):
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Iterable, Iterator
 import cv2
 import PIL
 
@@ -9,7 +9,7 @@ from super_gradients.common.abstractions.abstract_logger import get_logger
 
 logger = get_logger(__name__)
 
-__all__ = ["load_video", "save_video", "includes_video_extension", "show_video_from_disk", "show_video_from_frames"]
+__all__ = ["load_video", "lazy_load_video", "save_video", "includes_video_extension", "show_video_from_disk", "show_video_from_frames"]
 
 VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".wmv", ".flv", ".gif")
 
@@ -24,12 +24,29 @@ def load_video(file_path: str, max_frames: Optional[int] = None) -> Tuple[List[n
                 - Frames per Second (FPS).
     """
     cap = _open_video(file_path)
-    frames = _extract_frames(cap, max_frames)
     fps = cap.get(cv2.CAP_PROP_FPS)
-    cap.release()
+    frames = list(_lazy_extract_frames(cap, max_frames))
     return frames, fps
 
 
+def lazy_load_video(file_path: str, max_frames: Optional[int] = None) -> Tuple[Iterator[np.ndarray], int, float]:
+    """Open a video file and return a generator which yields its frames one by one, so that the video is never fully loaded into memory.
+
+    :param file_path:   Path to the video file.
+    :param max_frames:  Optional, maximum number of frames to extract.
+    :return:
+                - Generator yielding frames representing the video, each in (H, W, C), RGB.
+                - Number of frames in the video (as reported by the video metadata).
+                - Frames per Second (FPS).
+    """
+    cap = _open_video(file_path)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    num_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if max_frames is not None:
+        num_frames = min(num_frames, max_frames)
+    return _lazy_extract_frames(cap, max_frames), num_frames, fps
+
+
 def _open_video(file_path: str) -> cv2.VideoCapture:
     """Open a video file.
 
@@ -43,29 +60,31 @@ def _open_video(file_path: str) -> cv2.VideoCapture:
     return cap
 
 
-def _extract_frames(cap: cv2.VideoCapture, max_frames: Optional[int] = None) -> List[np.ndarray]:
-    """Extract frames from an opened video capture object.
+def _lazy_extract_frames(cap: cv2.VideoCapture, max_frames: Optional[int] = None) -> Iterator[np.ndarray]:
+    """Lazily extract frames from an opened video capture object. The capture object is released once all the frames were read.
 
     :param cap:         Opened video capture object.
     :param max_frames:  Optional maximum number of frames to extract.
-    :return:            Frames representing the video, each in (H, W, C), RGB.
+    :return:            Generator yielding frames representing the video, each in (H, W, C), RGB.
     """
-    frames = []
-
-    while max_frames != len(frames):
-        frame_read_success, frame = cap.read()
-        if not frame_read_success:
-            break
-        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-
-    return frames
+    try:
+        num_extracted_frames = 0
+        while max_frames != num_extracted_frames:
+            frame_read_success, frame = cap.read()
+            if not frame_read_success:
+                break
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            num_extracted_frames += 1
+    finally:
+        cap.release()
 
 
-def save_video(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_video(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally. Depending on the extension, the video will be saved as a .mp4 file or as a .gif file.
 
     :param output_path: Where the video will be saved
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
+                        Can be a generator, in which case the frames are written one by one without being loaded into memory all at once.
     :param fps:         Frames per second
     """
     if not includes_video_extension(output_path):
@@ -78,27 +97,33 @@ def save_video(output_path: str, frames: List[np.ndarray], fps: int) -> None:
         save_mp4(output_path, frames, fps)
 
 
-def save_gif(output_path: str, frames: List[np.ndarray], fps: int) -> None:
+def save_gif(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
     """Save a video locally in .gif format.
 
     :param output_path: Where the video will be saved
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
     :param fps:         Frames per second
     """
+    frames_pil = (PIL.Image.fromarray(frame) for frame in frames)
+    first_frame_pil = next(frames_pil, None)
+    if first_frame_pil is None:
+        raise RuntimeError("Cannot save a video without any frame.")
 
-    frames_pil = [PIL.Image.fromarray(frame) for frame in frames]
-
-    frames_pil[0].save(output_path, save_all=True, append_images=frames_pil[1:], duration=int(1000 / fps), loop=0)
+    first_frame_pil.save(output_path, save_all=True, append_images=frames_pil, duration=int(1000 / fps), loop=0)
 
 
-def save_mp4(output_path: str, frames: List[np.ndarray], fps: int) -> None:
-    """Save a video locally in .mp4 format.
+def save_mp4(output_path: str, frames: Iterable[np.ndarray], fps: int) -> None:
+    """Save a video locally in .mp4 format. The frames are written one by one, so they can be provided by a generator.
 
     :param output_path: Where the video will be saved
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
     :param fps:         Frames per second
     """
-    video_height, video_width = _validate_frames(frames)
+    frames = iter(frames)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        raise RuntimeError("Cannot save a video without any frame.")
+    video_height, video_width = _validate_frames([first_frame])
 
     video_writer = cv2.VideoWriter(
         output_path,
@@ -107,10 +132,13 @@ def save_mp4(output_path: str, frames: List[np.ndarray], fps: int) -> None:
         (video_width, video_height),
     )
 
-    for frame in frames:
-        video_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-
-    video_writer.release()
+    try:
+        video_writer.write(cv2.cvtColor(first_frame, cv2.COLOR_RGB2BGR))
+        for frame in frames:
+            _validate_frames([first_frame, frame])
+            video_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+    finally:
+        video_writer.release()
 
 
 def _validate_frames(frames: List[np.ndarray]) -> Tuple[float, float]:
@@ -165,7 +193,7 @@ def show_video_from_disk(video_path: str, window_name: str = "Prediction"):
     cv2.waitKey(1)
 
 
-def show_video_from_frames(frames: List[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
+def show_video_from_frames(frames: Iterable[np.ndarray], fps: float, window_name: str = "Prediction") -> None:
     """Display a video from a list of frames using OpenCV.
 
     :param frames:      Frames representing the video, each in (H, W, C), RGB. Note that all the frames are expected to have the same shape.
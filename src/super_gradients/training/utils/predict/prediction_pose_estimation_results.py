@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import List, Iterator
 
 import numpy as np
 
@@ -240,8 +240,32 @@ class VideoPoseEstimationPrediction(VideoPredictions):
 
         :return:                List of images with predicted bboxes. Note that this does not modify the original image.
         """
-        frames_with_bbox = [
-            result.draw(
+        frames_with_bbox = self._draw_frames(
+            edge_colors=edge_colors,
+            joint_thickness=joint_thickness,
+            keypoint_colors=keypoint_colors,
+            keypoint_radius=keypoint_radius,
+            box_thickness=box_thickness,
+            show_confidence=show_confidence,
+        )
+        return list(frames_with_bbox)
+
+    def _draw_frames(
+        self,
+        edge_colors=None,
+        joint_thickness: int = 2,
+        keypoint_colors=None,
+        keypoint_radius: int = 5,
+        box_thickness: int = 2,
+        show_confidence: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """Lazily draw the predicted poses on the images, one frame at a time, to avoid holding a copy of the whole video in memory.
+        See `draw` for the description of the parameters.
+
+        :return: Generator yielding the images with predicted poses.
+        """
+        for result in self._images_prediction_lst:
+            yield result.draw(
                 edge_colors=edge_colors,
                 joint_thickness=joint_thickness,
                 keypoint_colors=keypoint_colors,
@@ -249,9 +273,6 @@ class VideoPoseEstimationPrediction(VideoPredictions):
                 box_thickness=box_thickness,
                 show_confidence=show_confidence,
             )
-            for result in self._images_prediction_lst
-        ]
-        return frames_with_bbox
 
     def show(
         self,
@@ -275,7 +296,7 @@ class VideoPoseEstimationPrediction(VideoPredictions):
         :param show_confidence: Whether to show confidence scores on the image.
         :param box_thickness:   Thickness of bounding boxes.
         """
-        frames = self.draw(
+        frames = self._draw_frames(
             edge_colors=edge_colors,
             joint_thickness=joint_thickness,
             keypoint_colors=keypoint_colors,
@@ -309,7 +330,7 @@ class VideoPoseEstimationPrediction(VideoPredictions):
         :param show_confidence: Whether to show confidence scores on the image.
         :param box_thickness:   Thickness of bounding boxes.
         """
-        frames = self.draw(
+        frames = self._draw_frames(
             edge_colors=edge_colors,
             joint_thickness=joint_thickness,
             keypoint_colors=keypoint_colors,
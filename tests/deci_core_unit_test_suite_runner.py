@@ -26,6 +26,7 @@ from tests.unit_tests import (
 from tests.end_to_end_tests import TestTrainer
 from tests.unit_tests.detection_utils_test import TestDetectionUtils
 from tests.unit_tests.detection_dataset_test import DetectionDatasetTest
+from tests.unit_tests.detection_collate_fn_test import DetectionCollateFNTest
 from tests.unit_tests.export_onnx_test import TestModelsONNXExport
 from tests.unit_tests.load_checkpoint_test import LoadCheckpointTest
 from tests.unit_tests.local_ckpt_head_replacement_test import LocalCkptHeadReplacementTest
@@ -51,6 +52,7 @@ from tests.unit_tests.update_param_groups_unit_test import UpdateParamGroupsTest
 from tests.unit_tests.vit_unit_test import TestViT
 from tests.unit_tests.yolo_nas_tests import TestYOLONAS
 from tests.unit_tests.yolox_unit_test import TestYOLOX
+from tests.unit_tests.training_stage_switch_callback_test import YoloXTrainingStageSwitchCallbackTest
 from tests.unit_tests.lr_cooldown_test import LRCooldownTest
 from tests.unit_tests.detection_targets_format_transform_test import DetectionTargetsTransformTest
 from tests.unit_tests.forward_pass_prep_fn_test import ForwardpassPrepFNTest
@@ -67,6 +69,8 @@ from tests.unit_tests.repvgg_block_tests import TestRepVGGBlock
 from tests.unit_tests.training_utils_test import TestTrainingUtils
 from tests.unit_tests.dekr_loss_test import DEKRLossTest
 from tests.unit_tests.pose_estimation_metrics_test import TestPoseEstimationMetrics
+from tests.unit_tests.video_utils_test import VideoUtilsTest
+from tests.unit_tests.pipeline_test import PipelineTest
 
 
 class CoreUnitTestSuiteRunner:
@@ -105,6 +109,7 @@ class CoreUnitTestSuiteRunner:
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(KDEMATest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(KDTrainerTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestYOLOX))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(YoloXTrainingStageSwitchCallbackTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(InitializeWithDataloadersTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(LRCooldownTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(DetectionTargetsTransformTest))
@@ -128,6 +133,7 @@ class CoreUnitTestSuiteRunner:
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestRepVGGBlock))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(LocalCkptHeadReplacementTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(DetectionDatasetTest))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(DetectionCollateFNTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestModelsONNXExport))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(MaxBatchesLoopBreakTest))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestTrainingUtils))
@@ -145,6 +151,8 @@ class CoreUnitTestSuiteRunner:
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestPostPredictionCallback))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TestSegmentationMetricsMultipleIgnored))
         self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(TrainWithTorchSchedulerTest))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(VideoUtilsTest))
+        self.unit_tests_suite.addTest(self.test_loader.loadTestsFromModule(PipelineTest))
 
     def _add_modules_to_end_to_end_tests_suite(self):
         """
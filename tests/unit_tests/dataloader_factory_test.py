@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from torch.utils.data import DataLoader, TensorDataset, RandomSampler
@@ -45,6 +47,7 @@ from super_gradients.training.dataloaders.dataloaders import (
     mapillary_train,
     mapillary_val,
 )
+from super_gradients.training.dataloaders.num_workers_tuning import tune_num_workers
 from super_gradients.training.datasets import (
     COCODetectionDataset,
     ImageNetDataset,
@@ -297,6 +300,23 @@ class DataLoaderFactoryTest(unittest.TestCase):
         self.assertTrue(isinstance(dl.dataset, FixedLenDataset))
         self.assertTrue(isinstance(dl.sampler, RandomSampler))
 
+    def test_tune_num_workers(self):
+        dataset = TensorDataset(torch.randn(64, 3, 8, 8))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "sg_dataloader_tuning.json")
+            num_workers = tune_num_workers(dataset, {"batch_size": 4}, candidate_values=(1, 2), n_iters=4, n_warmup_iters=1, cache_path=cache_path)
+            self.assertIn(num_workers, (1, 2))
+            self.assertTrue(os.path.exists(cache_path))
+
+            # Second call is served from the cache, even with candidates that could not have been selected otherwise
+            self.assertEqual(tune_num_workers(dataset, {"batch_size": 4}, candidate_values=(3,), cache_path=cache_path), num_workers)
+
+            # The CPUs are split between the processes, and the number of processes is part of the cache key
+            num_workers = tune_num_workers(
+                dataset, {"batch_size": 4}, candidate_values=(1, 2), n_iters=4, n_warmup_iters=1, cache_path=cache_path, num_processes=os.cpu_count()
+            )
+            self.assertEqual(num_workers, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
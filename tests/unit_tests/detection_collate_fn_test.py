@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+import torch
+
+from super_gradients.training.utils.detection_utils import DetectionCollateFN
+
+
+class DetectionCollateFNTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.num_targets_per_image = [3, 0, 5, 1]
+        self.samples = [
+            (np.zeros((64, 64, 3), dtype=np.uint8), np.random.rand(num_targets, 5).astype(np.float32)) for num_targets in self.num_targets_per_image
+        ]
+
+    def test_format_targets(self):
+        _, targets = DetectionCollateFN()(self.samples)
+
+        self.assertEqual(targets.shape, (sum(self.num_targets_per_image), 6))
+
+        offset = 0
+        for i, (_, labels) in enumerate(self.samples):
+            image_targets = targets[offset : offset + len(labels)]
+            self.assertTrue((image_targets[:, 0] == i).all())
+            self.assertTrue(torch.equal(image_targets[:, 1:], torch.from_numpy(labels)))
+            offset += len(labels)
+
+
+if __name__ == "__main__":
+    unittest.main()
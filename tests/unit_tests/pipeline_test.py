@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+import torch
+from torch import nn
+
+from super_gradients.training.models.sg_module import SgModule
+from super_gradients.training.pipelines.pipelines import DetectionPipeline
+from super_gradients.training.processing import ImagePermute, StandardizeImage
+
+
+class RecordingModel(SgModule):
+    """Dummy model keeping track of the inputs it received."""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv2d(3, 4, kernel_size=1)
+        self.bn = nn.BatchNorm2d(4)
+        self.inputs = []
+
+    def forward(self, x):
+        self.inputs.append(x.clone())
+        return self.bn(self.conv(x))
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = RecordingModel()
+
+    def _get_pipeline(self, fuse_model: bool = False, post_prediction_callback=None) -> DetectionPipeline:
+        return DetectionPipeline(
+            model=self.model,
+            class_names=["class_0"],
+            post_prediction_callback=post_prediction_callback or (lambda output, device: [None] * len(output)),
+            image_processor=[StandardizeImage(max_value=255.0), ImagePermute(permutation=(2, 0, 1))],
+            fuse_model=fuse_model,
+        )
+
+    @staticmethod
+    def _get_images(num_images: int, shape=(16, 24, 3)):
+        return [np.random.randint(0, 255, size=shape, dtype=np.uint8) for _ in range(num_images)]
+
+    def test_staged_inputs_match_stacked_images(self):
+        """Check that the inputs given to the model are the same as stacking the images, when the staging buffer is reused or reallocated."""
+        pipeline = self._get_pipeline()
+
+        batches = []
+        for images, batch_size in [(self._get_images(4), 3), (self._get_images(3, shape=(24, 16, 3)), 3), (self._get_images(2), 3)]:
+            pipeline(images, batch_size=batch_size)
+            batches.extend(images[i : i + batch_size] for i in range(0, len(images), batch_size))
+
+        self.assertEqual([len(model_input) for model_input in self.model.inputs], [3, 1, 3, 2])
+        for model_input, images in zip(self.model.inputs, batches):
+            expected_input = torch.from_numpy(np.stack([(image / 255.0).astype(np.float32).transpose(2, 0, 1) for image in images]))
+            self.assertTrue(torch.equal(model_input, expected_input))
+
+    def test_images_to_device_reallocates_staging_buffer(self):
+        """Check when the staging buffer is reused or reallocated, and that on CPU the returned batch is a view of the buffer."""
+        pipeline = self._get_pipeline()
+
+        images = [np.random.rand(3, 8, 8).astype(np.float32) for _ in range(3)]
+        torch_inputs = pipeline._images_to_device(images)
+        staged_inputs = pipeline._staged_inputs
+        self.assertTrue(torch.equal(torch_inputs, torch.from_numpy(np.stack(images))))
+        self.assertEqual(torch_inputs.data_ptr(), staged_inputs.data_ptr())
+
+        # A smaller batch reuses the buffer
+        torch_inputs = pipeline._images_to_device(images[:1])
+        self.assertIs(pipeline._staged_inputs, staged_inputs)
+        self.assertTrue(torch.equal(torch_inputs, torch.from_numpy(np.stack(images[:1]))))
+
+        # A larger batch, another shape or another dtype need a new buffer
+        for new_images in ([*images, images[0]], [np.random.rand(3, 4, 4).astype(np.float32)], [image.astype(np.float64) for image in images]):
+            torch_inputs = pipeline._images_to_device(new_images)
+            self.assertIsNot(pipeline._staged_inputs, staged_inputs)
+            self.assertTrue(torch.equal(torch_inputs, torch.from_numpy(np.stack(new_images))))
+            staged_inputs = pipeline._staged_inputs
+
+    def test_decode_model_output_splits_predictions_per_image(self):
+        """Check that each image gets back exactly its own predictions, whether the post prediction callback returns None, empty or non-empty tensors."""
+        post_nms_predictions = [None, torch.zeros((0, 6)), torch.rand(2, 6), None, torch.rand(3, 6).half()]
+        pipeline = self._get_pipeline(post_prediction_callback=lambda output, device: post_nms_predictions)
+
+        predictions = pipeline._decode_model_output(model_output=None, model_input=torch.zeros(len(post_nms_predictions), 3, 8, 8))
+
+        self.assertEqual(len(predictions), len(post_nms_predictions))
+        for prediction, expected_prediction in zip(predictions, post_nms_predictions):
+            expected_prediction = np.zeros((0, 6), dtype=np.float32) if expected_prediction is None else expected_prediction.float().numpy()
+            np.testing.assert_array_equal(prediction.bboxes_xyxy, expected_prediction[:, :4])
+            np.testing.assert_array_equal(prediction.confidence, expected_prediction[:, 4])
+            np.testing.assert_array_equal(prediction.labels, expected_prediction[:, 5])
+
+    def test_predict_restores_training_mode(self):
+        """Check that predicting with a model in training mode does not update it, and leaves every submodule in training mode."""
+        for fuse_model in (False, True):
+            with self.subTest(fuse_model=fuse_model):
+                self.model.train()
+                running_mean = self.model.bn.running_mean.clone()
+
+                self._get_pipeline(fuse_model=fuse_model)(self._get_images(2), batch_size=2)
+
+                self.assertTrue(all(module.training for module in self.model.modules()))
+                self.assertTrue(torch.equal(self.model.bn.running_mean, running_mean))
+
+    def test_predict_sets_submodules_in_eval_mode(self):
+        """Check that submodules left in training mode are put in eval mode for the prediction, so BatchNorm statistics are not updated."""
+        for fuse_model in (False, True):
+            with self.subTest(fuse_model=fuse_model):
+                self.model.eval()
+                self.model.bn.train()
+                running_mean = self.model.bn.running_mean.clone()
+
+                self._get_pipeline(fuse_model=fuse_model)(self._get_images(2), batch_size=2)
+
+                self.assertTrue(torch.equal(self.model.bn.running_mean, running_mean))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,22 @@ import os
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from super_gradients import Trainer
 from super_gradients.training import models
 from super_gradients.training.datasets import COCODetectionDataset
 from super_gradients.training.metrics import DetectionMetrics
 from super_gradients.training.models import YoloXPostPredictionCallback
-from super_gradients.training.processing import ReverseImageChannels, DetectionLongestMaxSizeRescale, DetectionBottomRightPadding, ImagePermute
+from super_gradients.training.processing import (
+    ReverseImageChannels,
+    DetectionLongestMaxSizeRescale,
+    DetectionBottomRightPadding,
+    ImagePermute,
+    ComposeProcessing,
+    StandardizeImage,
+    NormalizeImage,
+)
 from super_gradients.training.utils.detection_utils import DetectionCollateFN, CrowdDetectionCollateFN
 from super_gradients.training import dataloaders
 
@@ -176,6 +186,30 @@ class PreprocessingUnitTest(unittest.TestCase):
         self.assertEqual(model._default_nms_iou, 0.65)
         self.assertEqual(model._default_nms_conf, 0.5)
 
+    def test_preprocess_images_matches_preprocess_image(self):
+        """Validate that processing a batch of images gives the same result as processing each image on its own."""
+        image_processor = ComposeProcessing(
+            [
+                ReverseImageChannels(),
+                DetectionLongestMaxSizeRescale(output_shape=(64, 64)),
+                DetectionBottomRightPadding(output_shape=(64, 64), pad_value=114),
+                StandardizeImage(max_value=255.0),
+                NormalizeImage(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+                ImagePermute(permutation=(2, 0, 1)),
+            ]
+        )
+        images = [np.random.randint(0, 255, size=shape, dtype=np.uint8) for shape in [(48, 64, 3), (64, 32, 3), (100, 100, 3)]]
+
+        processed_images, metadata_lst = image_processor.preprocess_images(images=images)
+
+        self.assertEqual(len(processed_images), len(images))
+        for image, processed_image, metadata in zip(images, processed_images, metadata_lst):
+            expected_image, expected_metadata = image_processor.preprocess_image(image=image)
+            self.assertEqual(processed_image.shape, (3, 64, 64))
+            self.assertEqual(processed_image.dtype, expected_image.dtype)
+            np.testing.assert_allclose(processed_image, expected_image, rtol=1e-6)
+            self.assertEqual(metadata, expected_metadata)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from types import SimpleNamespace
+
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from super_gradients.training.utils.callbacks import PhaseContext, YoloXTrainingStageSwitchCallback
+
+
+class ClosableTransform:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ClosableTransformDataset(Dataset):
+    """Dataset returning whether its transform was closed, as seen by the process loading the sample."""
+
+    def __init__(self, num_samples: int):
+        self.num_samples = num_samples
+        self.transforms = [ClosableTransform()]
+
+    def __len__(self):
+        return self.num_samples
+
+    def __getitem__(self, index):
+        return torch.tensor(self.transforms[0].closed)
+
+
+class YoloXTrainingStageSwitchCallbackTest(unittest.TestCase):
+    def test_stage_switch_restarts_persistent_workers(self):
+        train_loader = DataLoader(ClosableTransformDataset(num_samples=8), batch_size=2, num_workers=2, persistent_workers=True)
+        criterion = SimpleNamespace(use_l1=False)
+
+        self.assertFalse(any(batch.any() for batch in train_loader))
+
+        callback = YoloXTrainingStageSwitchCallback(next_stage_start_epoch=1)
+        callback(PhaseContext(epoch=1, train_loader=train_loader, criterion=criterion))
+
+        self.assertTrue(all(batch.all() for batch in train_loader))
+        self.assertTrue(criterion.use_l1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import PIL.Image
+
+from super_gradients.training.utils.media.video import lazy_load_video, save_gif, save_mp4, save_video
+
+
+class VideoUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.frames = [np.full((32, 48, 3), fill_value=i * 20, dtype=np.uint8) for i in range(10)]
+        self.fps = 10
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_save_mp4_from_generator(self):
+        output_path = os.path.join(self.tmp_dir.name, "video.mp4")
+        save_mp4(output_path, frames=(frame for frame in self.frames), fps=self.fps)
+
+        frames, num_frames, fps = lazy_load_video(output_path)
+        self.assertNotIsInstance(frames, list)
+        frames = list(frames)
+        self.assertEqual(num_frames, len(self.frames))
+        self.assertEqual(len(frames), len(self.frames))
+        self.assertEqual(frames[0].shape, self.frames[0].shape)
+        self.assertAlmostEqual(fps, self.fps, delta=0.1)
+
+    def test_lazy_load_video_max_frames(self):
+        output_path = os.path.join(self.tmp_dir.name, "video.mp4")
+        save_mp4(output_path, frames=self.frames, fps=self.fps)
+
+        frames, num_frames, _ = lazy_load_video(output_path, max_frames=4)
+        self.assertEqual(num_frames, 4)
+        self.assertEqual(len(list(frames)), 4)
+
+    def test_save_gif_from_generator(self):
+        output_path = os.path.join(self.tmp_dir.name, "video.gif")
+        save_gif(output_path, frames=(frame for frame in self.frames), fps=self.fps)
+
+        with PIL.Image.open(output_path) as gif:
+            self.assertEqual(gif.n_frames, len(self.frames))
+            self.assertEqual(gif.size, (self.frames[0].shape[1], self.frames[0].shape[0]))
+
+    def test_save_video_without_frames(self):
+        for file_name in ("video.mp4", "video.gif"):
+            with self.assertRaises(RuntimeError):
+                save_video(os.path.join(self.tmp_dir.name, file_name), frames=iter([]), fps=self.fps)
+
+
+if __name__ == "__main__":
+    unittest.main()
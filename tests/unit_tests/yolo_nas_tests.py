@@ -1,9 +1,14 @@
 import unittest
 
 import torch
+import torch.nn.functional as F
+from torch import nn
 
 from super_gradients.common.object_names import Models
 from super_gradients.training import models
+from super_gradients.training.models.detection_models.yolo_nas.dfl_heads import NDFLHeads, YoloNASDFLHead
+from super_gradients.training.utils import torch_version_is_greater_or_equal
+from super_gradients.training.utils.bbox_utils import batch_distance2bbox
 
 
 class TestYOLONAS(unittest.TestCase):
@@ -17,6 +22,130 @@ class TestYOLONAS(unittest.TestCase):
         model = models.get(Models.YOLO_NAS_S, arch_params=dict(in_channels=2), num_classes=17)
         model(torch.rand(1, 2, 640, 640))
 
+    def test_ndfl_heads_forward_eval(self):
+        """
+        Validate that the decoded and raw predictions of NDFLHeads.forward_eval match a per-level reference implementation of the decoding.
+        """
+        heads = models.get(Models.YOLO_NAS_S, num_classes=17).heads.eval()
+        feats = self._get_heads_inputs(heads)
+
+        with torch.no_grad():
+            (pred_bboxes, pred_scores), (cls_score_list, reg_distri_list, *_) = heads(feats)
+            expected_bboxes, expected_scores, expected_cls_score_list, expected_reg_distri_list = self._reference_decode(heads, feats)
+
+        self.assertTrue(torch.allclose(pred_bboxes, expected_bboxes, atol=1e-4))
+        self.assertTrue(torch.allclose(pred_scores, expected_scores, atol=1e-6))
+        self.assertTrue(torch.allclose(cls_score_list, expected_cls_score_list, atol=1e-6))
+        self.assertTrue(torch.allclose(reg_distri_list, expected_reg_distri_list, atol=1e-6))
+
+    def test_ndfl_heads_forward_eval_traced(self):
+        """
+        Validate that the traced (export) branch of NDFLHeads.forward_eval gives the same predictions as the eager one.
+        """
+        heads = models.get(Models.YOLO_NAS_S, num_classes=17).heads.eval()
+        feats = self._get_heads_inputs(heads)
+
+        with torch.no_grad():
+            (pred_bboxes, pred_scores), _ = heads(feats)
+            traced_heads = torch.jit.trace(heads, (feats,))
+            traced_bboxes, traced_scores = traced_heads(feats)
+
+        self.assertTrue(torch.allclose(pred_bboxes, traced_bboxes, atol=1e-4))
+        self.assertTrue(torch.allclose(pred_scores, traced_scores, atol=1e-6))
+
+    @unittest.skipIf(not torch_version_is_greater_or_equal(2, 0), "torch.compile requires PyTorch 2.0 or greater")
+    def test_ndfl_heads_torch_compile_eval(self):
+        """
+        Validate that running the eval forward pass through torch.compile gives the same predictions as the eager forward pass.
+        """
+        heads_list = [{"YoloNASDFLHead": {"inter_channels": 32, "width_mult": 1.0, "first_conv_group_size": 0, "stride": stride}} for stride in (8, 16, 32)]
+        heads = NDFLHeads(num_classes=17, in_channels=(32, 64, 128), heads_list=heads_list, torch_compile_eval=True).eval()
+        feats = self._get_heads_inputs(heads)
+
+        with torch.no_grad():
+            (expected_bboxes, expected_scores), _ = heads.forward_eval(feats)
+            (pred_bboxes, pred_scores), _ = heads(feats)
+
+        self.assertTrue(torch.allclose(pred_bboxes, expected_bboxes, atol=1e-4))
+        self.assertTrue(torch.allclose(pred_scores, expected_scores, atol=1e-5))
+
+    def test_yolo_nas_dfl_head_prep_model_for_conversion(self):
+        """
+        Validate that merging the first cls and reg convolutions of YoloNASDFLHead does not change its predictions.
+        """
+        for first_conv_group_size in (0, -1):
+            with self.subTest(first_conv_group_size=first_conv_group_size):
+                head = YoloNASDFLHead(
+                    in_channels=32, inter_channels=64, width_mult=1.0, first_conv_group_size=first_conv_group_size, num_classes=17, stride=8, reg_max=16
+                )
+                self._randomize_batch_norms(head)
+                head.eval()
+                x = torch.randn(2, 32, 20, 20)
+
+                with torch.no_grad():
+                    expected_reg_output, expected_cls_output = head(x)
+                    head.prep_model_for_conversion(input_size=(160, 160))
+                    reg_output, cls_output = head(x)
+
+                self.assertIsNotNone(head.fused_first_convs)
+                self.assertTrue(torch.allclose(reg_output, expected_reg_output, atol=1e-5))
+                self.assertTrue(torch.allclose(cls_output, expected_cls_output, atol=1e-5))
+
+    def test_yolo_nas_prep_model_for_conversion(self):
+        """
+        Validate that the predictions of YOLO-NAS are the same before and after prep_model_for_conversion.
+        """
+        model = models.get(Models.YOLO_NAS_S, num_classes=17)
+        self._randomize_batch_norms(model)
+        model.eval()
+        x = torch.randn(1, 3, 128, 128)
+
+        with torch.no_grad():
+            (expected_bboxes, expected_scores), _ = model(x)
+            model.prep_model_for_conversion(input_size=(128, 128))
+            (pred_bboxes, pred_scores), _ = model(x)
+
+        self.assertTrue(torch.allclose(pred_bboxes, expected_bboxes, atol=1e-3))
+        self.assertTrue(torch.allclose(pred_scores, expected_scores, atol=1e-4))
+
+    @staticmethod
+    def _randomize_batch_norms(model: nn.Module):
+        """Set random affine parameters and running statistics to every BatchNorm, so that merging them would not go unnoticed."""
+        with torch.no_grad():
+            for module in model.modules():
+                if isinstance(module, nn.BatchNorm2d):
+                    module.weight.uniform_(0.5, 1.5)
+                    module.bias.uniform_(-0.5, 0.5)
+                    module.running_mean.uniform_(-0.5, 0.5)
+                    module.running_var.uniform_(0.5, 1.5)
+
+    @staticmethod
+    def _get_heads_inputs(heads, batch_size: int = 2, image_size: int = 128):
+        return tuple(
+            torch.randn(batch_size, channels, image_size // stride, image_size // stride) for channels, stride in zip(heads.in_channels, heads.fpn_strides)
+        )
+
+    @staticmethod
+    def _reference_decode(heads, feats):
+        """Per-level decoding of the NDFLHeads predictions, with the reduction of the bins done with a 1x1 convolution over the projection vector."""
+        proj_conv = heads.proj.reshape([1, heads.reg_max + 1, 1, 1])
+        cls_score_list, reg_distri_list, reg_dist_reduced_list = [], [], []
+        for i, feat in enumerate(feats):
+            _, _, h, w = feat.shape
+            reg_distri, cls_logit = getattr(heads, f"head{i + 1}")(feat)
+            reg_distri_list.append(torch.permute(reg_distri.flatten(2), [0, 2, 1]))
+            reg_dist_reduced = torch.permute(reg_distri.reshape([-1, 4, heads.reg_max + 1, h * w]), [0, 2, 3, 1])
+            reg_dist_reduced_list.append(F.conv2d(F.softmax(reg_dist_reduced, dim=1), weight=proj_conv).squeeze(1))
+            cls_score_list.append(torch.permute(cls_logit.flatten(2), [0, 2, 1]))
+
+        cls_score_list = torch.cat(cls_score_list, dim=1)
+        reg_distri_list = torch.cat(reg_distri_list, dim=1)
+        reg_dist_reduced_list = torch.cat(reg_dist_reduced_list, dim=1)
+
+        anchor_points, stride_tensor = heads._generate_anchors(feats)
+        pred_bboxes = batch_distance2bbox(anchor_points, reg_dist_reduced_list) * stride_tensor
+        return pred_bboxes, cls_score_list.sigmoid(), cls_score_list, reg_distri_list
+
 
 if __name__ == "__main__":
     unittest.main()